@@ -1,6 +1,9 @@
 import asyncio
+import atexit
 import logging
 import logging.handlers
+import queue
+import random
 import signal
 import sys
 from typing import Optional, List
@@ -12,19 +15,32 @@ from src.services.storage_services import StorageService
 from src.config import Config
 from src.models import NewsItem
 
-# Configuración de logging estructurado con rotación de archivos
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.handlers.RotatingFileHandler(
-            'logs/werchter_monitor.log',
-            maxBytes=5_000_000,  # 5MB
-            backupCount=5
-        )
-    ]
+# Configuración de logging estructurado con rotación de archivos.
+# Los registros se encolan desde el event loop y un hilo en segundo plano
+# (QueueListener) se encarga de la escritura en consola y disco.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.StreamHandler(sys.stdout),
+    logging.handlers.RotatingFileHandler(
+        'logs/werchter_monitor.log',
+        maxBytes=5_000_000,  # 5MB
+        backupCount=5
+    )
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue: queue.Queue = queue.Queue(-1)
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_log_handlers, respect_handler_level=True
 )
+_log_listener.start()
+# Vacía la cola pendiente al terminar el proceso, incluidos los mensajes
+# emitidos después de shutdown()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 class WerchterMonitor:
@@ -41,6 +57,9 @@ class WerchterMonitor:
         storage_service (StorageService): Servicio de persistencia
     """
     
+    # Número máximo de notificaciones enviadas en paralelo a Telegram
+    MAX_CONCURRENT_SENDS = 5
+    
     def __init__(self, config: Config):
         """
         Inicializa el monitor con su configuración y servicios.
@@ -76,8 +95,8 @@ class WerchterMonitor:
         """
         Ejecuta el ciclo principal del monitor.
         
-        Implementa un patrón de retry con backoff exponencial para manejar errores
-        y evitar sobrecarga del sistema en caso de fallos.
+        Implementa un patrón de retry con backoff exponencial acotado y jitter
+        para manejar errores y evitar sobrecarga del sistema en caso de fallos.
         """
         logger.info("Iniciando monitorización de Rock Werchter")
         consecutive_errors = 0
@@ -97,11 +116,14 @@ class WerchterMonitor:
                 
             except Exception as e:
                 consecutive_errors += 1
-                wait_time = min(2 ** consecutive_errors * 30, 3600)
+                # Exponente acotado y jitter para evitar reintentos sincronizados
+                exponent = min(consecutive_errors, 7)
+                wait_time = min(2 ** exponent * 30, 3600)
+                wait_time = random.uniform(wait_time * 0.5, wait_time)
                 
                 logger.error(
                     f"Error en ciclo de monitorización (intento {consecutive_errors}): "
-                    f"{str(e)}. Esperando {wait_time} segundos antes de reintentar.",
+                    f"{str(e)}. Esperando {wait_time:.0f} segundos antes de reintentar.",
                     exc_info=True
                 )
                 
@@ -123,6 +145,12 @@ class WerchterMonitor:
         logger.info("Iniciando proceso de apagado controlado...")
         self._shutdown_event.set()
         
+        try:
+            await self.news_service.close()
+            logger.info("Sesión HTTP de noticias cerrada correctamente")
+        except Exception as e:
+            logger.error(f"Error cerrando sesión HTTP: {str(e)}")
+        
         try:
             await self.telegram_service.cleanup()
             logger.info("Recursos de Telegram liberados correctamente")
@@ -130,7 +158,8 @@ class WerchterMonitor:
             logger.error(f"Error durante limpieza de Telegram: {str(e)}")
             
         try:
-            self.storage_service.cleanup_old_entries()
+            await self.storage_service.aflush()
+            await self.storage_service.acleanup_old_entries()
             logger.info("Limpieza de almacenamiento completada")
         except Exception as e:
             logger.error(f"Error durante limpieza de almacenamiento: {str(e)}")
@@ -155,6 +184,8 @@ class WerchterMonitor:
     async def _process_news_batch(self, news_items: List[NewsItem]) -> None:
         """
         Procesa un lote de noticias de manera atómica, enviando solo las nuevas.
+        Los envíos se realizan en paralelo, limitados por un semáforo para
+        respetar los límites de Telegram.
         
         Args:
             news_items: Lista de noticias a procesar
@@ -172,26 +203,38 @@ class WerchterMonitor:
             
         logger.info(f"Procesando {len(unprocessed_news)} noticias nuevas")
         
-        for news_item in unprocessed_news:
-            try:
-                logger.info(f"Procesando nueva noticia: {news_item.title}")
-                success = await self.telegram_service.send_notification(news_item)
-                
-                if success:
-                    self.storage_service.mark_as_processed(news_item)
-                    logger.info(f"Noticia procesada exitosamente: {news_item.title}")
-                else:
-                    logger.error(f"No se pudo procesar la noticia: {news_item.title}")
-                    
-            except Exception as e:
-                logger.error(
-                    f"Error procesando noticia {news_item.title}: {str(e)}",
-                    exc_info=True
-                )
-                continue
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+        
+        async def _send_one(news_item: NewsItem) -> bool:
+            async with semaphore:
+                try:
+                    logger.info(f"Procesando nueva noticia: {news_item.title}")
+                    return await self.telegram_service.send_notification(news_item)
+                except Exception as e:
+                    logger.error(
+                        f"Error procesando noticia {news_item.title}: {str(e)}",
+                        exc_info=True
+                    )
+                    return False
+        
+        results = await asyncio.gather(
+            *(_send_one(news_item) for news_item in unprocessed_news),
+            return_exceptions=True
+        )
+        
+        # El marcado se hace en el event loop, en el orden original del lote
+        for news_item, success in zip(unprocessed_news, results):
+            if success is True:
+                self.storage_service.mark_as_processed(news_item)
+                logger.info(f"Noticia procesada exitosamente: {news_item.title}")
+            else:
+                logger.error(f"No se pudo procesar la noticia: {news_item.title}")
+        
+        # Persistencia única del lote procesado
+        await self.storage_service.aflush()
         
         # Limpieza periódica de entradas antiguas
-        self.storage_service.cleanup_old_entries()
+        await self.storage_service.acleanup_old_entries()
 
 async def main() -> None:
     """
@@ -7,10 +7,14 @@ from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Configuración cargada por load_config, reutilizada en llamadas posteriores
+_cached_config: Optional['Config'] = None
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """
-    Gestiona la configuración de la aplicación implementando el patrón Singleton.
+    Gestiona la configuración inmutable de la aplicación.
+    Config.load_config es el constructor canónico y memoriza la instancia cargada.
     
     Attributes:
         telegram_bot_token (str): Token de autenticación del bot de Telegram
@@ -20,18 +24,12 @@ class Config:
     telegram_bot_token: str
     telegram_chat_id: str
     check_interval: int = 600
-    
-    _instance: Optional['Config'] = None
-    
-    def __new__(cls, *args, **kwargs):
-        if not cls._instance:
-            cls._instance = super(Config, cls).__new__(cls)
-        return cls._instance
 
     @classmethod
     def load_config(cls) -> 'Config':
         """
         Carga y valida la configuración desde variables de entorno.
+        Las llamadas posteriores devuelven la instancia ya cargada.
         
         Returns:
             Config: Instancia configurada
@@ -39,6 +37,10 @@ class Config:
         Raises:
             ValueError: Si faltan variables de entorno requeridas
         """
+        global _cached_config
+        if _cached_config is not None:
+            return _cached_config
+        
         load_dotenv(override=True)
         
         # Obtener variables de entorno con validación
@@ -90,7 +92,8 @@ class Config:
             )
         )
         
-        return cls(**config_values)
+        _cached_config = cls(**config_values)
+        return _cached_config
     
     def to_dict(self) -> Dict[str, Any]:
         """
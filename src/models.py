@@ -1,9 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 from .utils.date_parser import DateParser
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class NewsItem:
     """
     Modelo de datos para noticias con soporte para ordenamiento por fecha.
@@ -13,11 +13,26 @@ class NewsItem:
     date: str
     link: str
     image_url: Optional[str] = None
-    _parsed_date: Optional[datetime] = None
+    _parsed_date: Optional[datetime] = field(default=None, init=False)
+    _formatted_date: str = field(default='', init=False, repr=False)
+    _telegram_message: str = field(default='', init=False, repr=False)
     
     def __post_init__(self):
-        """Inicialización posterior a la creación para parsing de fecha."""
-        self._parsed_date = DateParser.parse_date(self.date)
+        """
+        Inicialización posterior a la creación: parsea la fecha y precalcula
+        los textos derivados, que no cambian al ser la instancia inmutable.
+        """
+        # La instancia es inmutable, por lo que se asigna a través de object
+        parsed_date = DateParser.parse_date(self.date)
+        formatted_date = DateParser.format_date(parsed_date)
+        object.__setattr__(self, '_parsed_date', parsed_date)
+        object.__setattr__(self, '_formatted_date', formatted_date)
+        object.__setattr__(self, '_telegram_message', (
+            f"🎸 *Nueva noticia de Rock Werchter*\n\n"
+            f"📌 *{self.title}*\n"
+            f"📅 Fecha: {formatted_date}\n"
+            f"🔗 [Leer más]({self.link})"
+        ))
     
     @property
     def formatted_date(self) -> str:
@@ -27,22 +42,27 @@ class NewsItem:
         Returns:
             String con la fecha formateada
         """
-        return DateParser.format_date(self._parsed_date)
+        return self._formatted_date
+    
+    @property
+    def sort_key(self) -> Tuple[bool, datetime]:
+        """
+        Clave de ordenamiento por fecha; las fechas no parseadas van al final.
+        
+        Returns:
+            Tupla comparable (sin_fecha, fecha)
+        """
+        return (self._parsed_date is None, self._parsed_date or datetime.min)
     
     @property
     def telegram_message(self) -> str:
         """
-        Genera el mensaje formateado para Telegram.
+        Obtiene el mensaje formateado para Telegram.
         
         Returns:
             String con el mensaje formateado
         """
-        return (
-            f"🎸 *Nueva noticia de Rock Werchter*\n\n"
-            f"📌 *{self.title}*\n"
-            f"📅 Fecha: {self.formatted_date}\n"
-            f"🔗 [Leer más]({self.link})"
-        )
+        return self._telegram_message
     
     def __lt__(self, other: 'NewsItem') -> bool:
         """Permite ordenamiento ascendente por fecha."""
@@ -1,48 +1,135 @@
+import asyncio
 import logging
-from typing import List
+from typing import Dict, List, Optional
 import aiohttp
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import xxhash
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from urllib.parse import urljoin, urlsplit
 from ..models import NewsItem
 
 logger = logging.getLogger(__name__)
 
+# Identificación del monitor en las peticiones HTTP
+USER_AGENT = "WerchterNews/1.0 (+https://github.com/magnoscg/WerchterNews)"
+
+# Tamaño de los bloques leídos del cuerpo de la respuesta
+CHUNK_SIZE = 8192
+
 class NewsService:
     """Servicio para obtener y procesar noticias de Rock Werchter."""
     
-    def __init__(self, base_url: str = "https://www.rockwerchter.be/en/"):
+    def __init__(self, base_url: str = "https://www.rockwerchter.be/en/", timeout: int = 30):
         self.base_url = base_url
+        self.timeout = timeout
+        # Origen precalculado para resolver rutas absolutas sin urljoin
+        base_split = urlsplit(base_url)
+        self._base_origin = f"{base_split.scheme}://{base_split.netloc}"
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        # Cache de la última respuesta para peticiones condicionales
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._cached_items: Optional[List[NewsItem]] = None
+        self._body_hash: Optional[int] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Obtiene la sesión HTTP compartida, creándola bajo demanda.
+        Reutilizar la sesión mantiene vivas las conexiones entre ciclos.
+        """
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    headers={'User-Agent': USER_AGENT}
+                )
+            return self._session
+    
+    async def close(self) -> None:
+        """Cierra la sesión HTTP compartida si existe."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def get_news(self) -> List[NewsItem]:
         """
         Obtiene las noticias ordenadas por fecha ascendente.
         
+        Usa peticiones condicionales (ETag/Last-Modified): si la página no ha
+        cambiado (HTTP 304) se devuelven las noticias cacheadas sin parsear.
+        Si el servidor no envía esas cabeceras, se compara un hash del cuerpo
+        con el del ciclo anterior para evitar igualmente el parsing.
+        
         Returns:
             List[NewsItem]: Lista ordenada de noticias
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url) as response:
-                    if response.status != 200:
-                        logger.error(f"Error fetching news: Status {response.status}")
-                        return []
-                    
-                    html = await response.text()
-                    news_items = self._parse_news_content(html)
-                    
-                    # Ordena las noticias por fecha
-                    return sorted(news_items)
+            session = await self._get_session()
+            async with session.get(self.base_url, headers=self._conditional_headers()) as response:
+                if response.status == 304 and self._cached_items is not None:
+                    logger.debug("Página sin cambios (304), usando noticias cacheadas")
+                    return self._cached_items
+                
+                if response.status != 200:
+                    logger.error(f"Error fetching news: Status {response.status}")
+                    return []
+                
+                # Lectura por bloques: el hash se calcula a medida que llegan los datos
+                body = bytearray()
+                hasher = xxhash.xxh64()
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    hasher.update(chunk)
+                    body.extend(chunk)
+                
+                # Cabeceras de validación solo tras leer el cuerpo completo
+                self._etag = response.headers.get('ETag')
+                self._last_modified = response.headers.get('Last-Modified')
+                
+                body_hash = hasher.intdigest()
+                if body_hash == self._body_hash and self._cached_items is not None:
+                    logger.debug("Contenido sin cambios, usando noticias cacheadas")
+                    return self._cached_items
+                
+                html = body.decode(response.charset or 'utf-8', errors='replace')
+                news_items = self._parse_news_content(html)
+                
+                # Ordena las noticias por fecha con una clave precalculada
+                self._cached_items = sorted(news_items, key=lambda item: item.sort_key)
+                self._body_hash = body_hash
+                return self._cached_items
                     
         except Exception as e:
             logger.error(f"Error fetching news: {str(e)}", exc_info=True)
             return []
     
+    def _conditional_headers(self) -> Dict[str, str]:
+        """Construye las cabeceras condicionales a partir de la última respuesta."""
+        headers = {}
+        if self._cached_items is None:
+            return headers
+        if self._etag:
+            headers['If-None-Match'] = self._etag
+        if self._last_modified:
+            headers['If-Modified-Since'] = self._last_modified
+        return headers
+    
+    def _join(self, url: str) -> str:
+        """
+        Resuelve una URL relativa contra base_url.
+        Las rutas absolutas del mismo host (caso habitual) evitan urljoin.
+        """
+        if url.startswith(('https://', 'http://')):
+            return url
+        if url.startswith('/') and not url.startswith('//') and '/.' not in url:
+            return self._base_origin + url
+        return urljoin(self.base_url, url)
+    
     def _parse_news_content(self, html: str) -> List[NewsItem]:
         """Parse del contenido HTML."""
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = LexborHTMLParser(html)
         news_items = []
         
-        for card in soup.select('.card-grid__grid .card'):
+        for card in tree.css('.card-grid__grid .card'):
             try:
                 news_item = self._parse_news_card(card)
                 if news_item:
@@ -53,16 +140,17 @@ class NewsService:
                 
         return news_items
             
-    def _parse_news_card(self, card) -> NewsItem:
+    def _parse_news_card(self, card: LexborNode) -> NewsItem:
         """Parse de una tarjeta de noticia individual."""
-        link = urljoin(self.base_url, card.get('href', ''))
-        title = card.select_one('.card__title').text.strip()
+        link = self._join(card.attributes.get('href') or '')
+        title = card.css_first('.card__title').text().strip()
         
-        date_element = card.select_one('.card__info')
-        date = date_element.text.split('visit')[0].strip() if date_element else ''
+        date_element = card.css_first('.card__info')
+        date = date_element.text().split('visit')[0].strip() if date_element else ''
         
-        image = card.select_one('.card__image img')
-        image_url = urljoin(self.base_url, image['src']) if image and 'src' in image.attrs else None
+        image = card.css_first('.card__image img')
+        image_src = image.attributes.get('src') if image else None
+        image_url = self._join(image_src) if image_src else None
         
         return NewsItem(
             title=title,
@@ -1,8 +1,11 @@
-import json
+import asyncio
 import logging
+import os
+import time
 from pathlib import Path
-from typing import Dict, Set, Optional
+from typing import Dict, List, Set
 from datetime import datetime
+import orjson
 from ..models import NewsItem
 
 logger = logging.getLogger(__name__)
@@ -11,27 +14,97 @@ class StorageService:
     """
     Servicio de almacenamiento persistente para control de estado de noticias.
     Implementa el patrón Repository con cache en memoria para optimizar rendimiento.
+    
+    El estado en memoria solo se modifica desde el event loop; los hilos usados
+    por aflush/acleanup_old_entries únicamente escriben bytes ya serializados.
     """
-    def __init__(self, storage_path: str = "data/processed_news.json"):
+    def __init__(self, storage_path: str = "data/processed_news.ndjson"):
         self.storage_path = Path(storage_path)
         self._processed_news: Dict[str, dict] = {}
         self._processed_links: Set[str] = set()
+        self._pending_records: List[dict] = []
+        self._dirty = False
+        # Serializa las escrituras en disco (append y compactación)
+        self._io_lock = asyncio.Lock()
         self._ensure_storage_exists()
         self._load_processed_news()
 
     def _ensure_storage_exists(self) -> None:
         """Asegura que el directorio y archivo de almacenamiento existan."""
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.storage_path.exists():
-            self._save_processed_news({})
+        if self.storage_path.exists():
+            return
+        legacy_path = self.storage_path.with_suffix('.json')
+        if legacy_path.exists():
+            # _compact crea el log mediante os.replace solo si la importación funciona
+            self._migrate_legacy_storage(legacy_path)
+        else:
+            self.storage_path.touch()
+
+    def _migrate_legacy_storage(self, legacy_path: Path) -> None:
+        """
+        Importa el antiguo almacenamiento JSON (diccionario completo).
+        
+        Raises:
+            RuntimeError: Si la importación falla. El log NDJSON no se crea, por
+                lo que la migración se reintenta en el siguiente arranque en lugar
+                de continuar con un historial vacío y reenviar todas las noticias.
+        """
+        try:
+            self._processed_news = orjson.loads(legacy_path.read_bytes())
+            if not self._compact():
+                raise RuntimeError(f"No se pudo escribir {self.storage_path}")
+            logger.info(f"Migradas {len(self._processed_news)} noticias desde {legacy_path}")
+        except Exception as e:
+            logger.error(f"Error migrando almacenamiento antiguo: {str(e)}")
+            raise RuntimeError(
+                f"Error migrando almacenamiento antiguo {legacy_path}: {str(e)}"
+            ) from e
+        finally:
+            self._processed_news = {}
 
     def _load_processed_news(self) -> None:
         """
-        Carga el estado desde almacenamiento persistente con manejo robusto de errores.
+        Carga el estado desde el log NDJSON (un registro por línea) con manejo
+        robusto de errores. Las líneas corruptas se descartan individualmente.
+        
+        Si hay líneas inválidas o el log no termina en salto de línea (append
+        interrumpido), se compacta para que el siguiente append no se concatene
+        al fragmento roto y se pierda.
         """
         try:
-            content = self.storage_path.read_text()
-            self._processed_news = json.loads(content)
+            migrated = 0
+            invalid = 0
+            ends_with_newline = True
+            with open(self.storage_path, 'rb') as f:
+                for line_number, line in enumerate(f, start=1):
+                    ends_with_newline = line.endswith(b'\n')
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = orjson.loads(line)
+                        link = record['link']
+                    except (ValueError, KeyError, TypeError) as e:
+                        invalid += 1
+                        logger.warning(
+                            f"Línea {line_number} inválida en almacenamiento: {str(e)}"
+                        )
+                        continue
+                    
+                    # Migra marcas de tiempo ISO antiguas (o inválidas) a timestamp Unix
+                    if not isinstance(record.get('processed_at'), int):
+                        record['processed_at'] = self._migrate_timestamp(
+                            record.get('processed_at')
+                        )
+                        migrated += 1
+                    self._processed_news[link] = record
+            if migrated or invalid or not ends_with_newline:
+                self._compact()
+            if migrated:
+                logger.info(f"Migradas {migrated} marcas de tiempo a formato Unix")
+            if invalid or not ends_with_newline:
+                logger.info("Log de almacenamiento reparado mediante compactación")
             # Actualiza el conjunto de enlaces procesados para búsqueda O(1)
             self._processed_links = set(self._processed_news.keys())
             logger.info(f"Cargadas {len(self._processed_links)} noticias procesadas")
@@ -40,23 +113,120 @@ class StorageService:
             self._processed_news = {}
             self._processed_links = set()
 
-    def _save_processed_news(self, data: Optional[Dict] = None) -> None:
+    @staticmethod
+    def _migrate_timestamp(value) -> int:
         """
-        Persiste el estado actual con formateo JSON legible.
+        Convierte una marca de tiempo ISO antigua a timestamp Unix.
+        Si no se puede interpretar, usa el instante actual para conservar el
+        registro como procesado en lugar de descartarlo y reenviar la noticia.
         
         Args:
-            data: Datos a persistir. Si es None, usa el estado actual.
+            value: Valor original de processed_at
+            
+        Returns:
+            int: Timestamp Unix
         """
         try:
-            content = json.dumps(
-                data if data is not None else self._processed_news,
-                indent=2,
-                ensure_ascii=False
-            )
-            self.storage_path.write_text(content)
-            logger.debug("Estado persistido exitosamente")
+            return int(datetime.fromisoformat(value).timestamp())
+        except (TypeError, ValueError):
+            logger.warning(f"Marca de tiempo inválida ({value!r}), usando la actual")
+            return int(time.time())
+
+    @staticmethod
+    def _encode_records(records) -> bytes:
+        """Serializa los registros en formato NDJSON."""
+        return b''.join(orjson.dumps(record) + b'\n' for record in records)
+
+    def _write_append(self, content: bytes) -> bool:
+        """
+        Añade contenido NDJSON al final del log en una única escritura.
+        Solo realiza I/O, por lo que puede ejecutarse en un hilo.
+        
+        Args:
+            content: Registros ya serializados
+            
+        Returns:
+            bool: True si el contenido se persistió correctamente
+        """
+        try:
+            with open(self.storage_path, 'ab') as f:
+                f.write(content)
+            logger.debug("Registros persistidos exitosamente")
+            return True
+        except Exception as e:
+            logger.error(f"Error persistiendo registros: {str(e)}")
+            return False
+
+    def _write_compacted(self, content: bytes) -> bool:
+        """
+        Reescribe el log completo de manera atómica (archivo temporal + os.replace).
+        Solo realiza I/O, por lo que puede ejecutarse en un hilo.
+        
+        Args:
+            content: Estado completo ya serializado
+            
+        Returns:
+            bool: True si el log se reescribió correctamente
+        """
+        tmp_path = self.storage_path.with_name(self.storage_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, self.storage_path)
+            logger.debug("Almacenamiento compactado exitosamente")
+            return True
         except Exception as e:
-            logger.error(f"Error persistiendo estado: {str(e)}")
+            logger.error(f"Error compactando almacenamiento: {str(e)}")
+            return False
+
+    def _take_pending(self) -> List[dict]:
+        """Extrae los registros pendientes y limpia la marca de cambios."""
+        records = self._pending_records
+        self._pending_records = []
+        self._dirty = False
+        return records
+
+    def _requeue(self, records: List[dict]) -> None:
+        """Devuelve a la cola registros cuya escritura ha fallado."""
+        if records:
+            self._pending_records[:0] = records
+            self._dirty = True
+
+    def _prepare_compaction(self):
+        """
+        Captura el estado para compactar. Los registros pendientes quedan
+        incluidos en la instantánea, por lo que se retiran de la cola.
+        
+        Returns:
+            Tupla (registros pendientes retirados, contenido serializado)
+        """
+        pending = self._take_pending()
+        return pending, self._encode_records(self._processed_news.values())
+
+    def _compact(self) -> bool:
+        """
+        Reescribe el log con el estado actual, incluidos los registros pendientes.
+        
+        Solo para el arranque (migraciones en el constructor): escribe sin
+        _io_lock, por lo que no debe ejecutarse una vez activo el event loop;
+        en ese caso se usa _acompact().
+        
+        Returns:
+            bool: True si el log se reescribió correctamente
+        """
+        pending, content = self._prepare_compaction()
+        if self._write_compacted(content):
+            return True
+        self._requeue(pending)
+        return False
+
+    async def _acompact(self) -> bool:
+        """Versión asíncrona de _compact() que escribe en un hilo."""
+        pending, content = self._prepare_compaction()
+        if await asyncio.to_thread(self._write_compacted, content):
+            return True
+        self._requeue(pending)
+        return False
 
     def is_processed(self, news_item: NewsItem) -> bool:
         """
@@ -67,23 +237,40 @@ class StorageService:
 
     def mark_as_processed(self, news_item: NewsItem) -> None:
         """
-        Marca una noticia como procesada y persiste el estado.
+        Marca una noticia como procesada en memoria. El registro se persiste
+        en la siguiente llamada a aflush().
         
         Args:
             news_item: Noticia a marcar como procesada
         """
         if not self.is_processed(news_item):
-            self._processed_news[news_item.link] = {
+            record = {
                 'title': news_item.title,
                 'date': news_item.formatted_date,
                 'link': news_item.link,
                 'image_url': news_item.image_url,
-                'processed_at': datetime.now().isoformat()
+                'processed_at': int(time.time())
             }
+            self._processed_news[news_item.link] = record
             self._processed_links.add(news_item.link)
-            self._save_processed_news()
+            self._pending_records.append(record)
+            self._dirty = True
             logger.info(f"Nueva noticia marcada como procesada: {news_item.title}")
 
+    async def aflush(self) -> None:
+        """
+        Persiste en una única escritura los registros pendientes, si los hay.
+        La cola se vacía y serializa en el event loop; solo la escritura se
+        ejecuta en un hilo, de forma exclusiva.
+        """
+        async with self._io_lock:
+            if not self._dirty:
+                return
+            records = self._take_pending()
+            content = self._encode_records(records)
+            if not await asyncio.to_thread(self._write_append, content):
+                self._requeue(records)
+
     def get_unprocessed_news(self, news_items: list[NewsItem]) -> list[NewsItem]:
         """
         Filtra y retorna solo las noticias no procesadas.
@@ -94,36 +281,46 @@ class StorageService:
         Returns:
             Lista de noticias no procesadas
         """
+        # Referencia local al set para evitar la búsqueda de atributo por elemento
+        processed_links = self._processed_links
         return [
-            news_item for news_item in news_items 
-            if not self.is_processed(news_item)
+            news_item for news_item in news_items
+            if news_item.link not in processed_links
+        ]
+
+    def _remove_old_entries(self, max_age_days: int) -> int:
+        """
+        Elimina de memoria las entradas más antiguas que max_age_days.
+        
+        Returns:
+            int: Número de entradas eliminadas
+        """
+        cutoff = int(time.time()) - max_age_days * 86400
+        entries_to_remove = [
+            link for link, data in self._processed_news.items()
+            if data['processed_at'] < cutoff
         ]
+        
+        for link in entries_to_remove:
+            self._processed_news.pop(link)
+            self._processed_links.remove(link)
+        
+        return len(entries_to_remove)
 
-    def cleanup_old_entries(self, max_age_days: int = 30) -> None:
+    async def acleanup_old_entries(self, max_age_days: int = 30) -> None:
         """
-        Limpia entradas antiguas del almacenamiento para optimizar rendimiento.
+        Limpia entradas antiguas y compacta el log de almacenamiento.
+        La limpieza en memoria se hace en el event loop y la compactación se
+        escribe en un hilo.
         
         Args:
             max_age_days: Edad máxima de entradas en días
         """
-        try:
-            current_time = datetime.now()
-            entries_to_remove = []
-            
-            for link, data in self._processed_news.items():
-                processed_time = datetime.fromisoformat(data['processed_at'])
-                age_days = (current_time - processed_time).days
-                
-                if age_days > max_age_days:
-                    entries_to_remove.append(link)
-            
-            for link in entries_to_remove:
-                self._processed_news.pop(link)
-                self._processed_links.remove(link)
-            
-            if entries_to_remove:
-                self._save_processed_news()
-                logger.info(f"Limpiadas {len(entries_to_remove)} entradas antiguas")
-                
-        except Exception as e:
-            logger.error(f"Error durante limpieza de entradas: {str(e)}")
\ No newline at end of file
+        async with self._io_lock:
+            try:
+                removed = self._remove_old_entries(max_age_days)
+                if removed and await self._acompact():
+                    logger.info(f"Limpiadas {removed} entradas antiguas")
+                    
+            except Exception as e:
+                logger.error(f"Error durante limpieza de entradas: {str(e)}")
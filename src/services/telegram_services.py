@@ -1,8 +1,9 @@
 from typing import Optional
 import asyncio
 import logging
-from datetime import datetime
+import random
 from telegram import Bot
+from telegram.error import BadRequest, NetworkError, RetryAfter, TimedOut
 from telegram.ext import Application
 from contextlib import asynccontextmanager
 
@@ -21,37 +22,39 @@ class TelegramService:
         self.timeout = timeout
         self._application: Optional[Application] = None
         self._bot: Optional[Bot] = None
-        self._last_initialization: Optional[datetime] = None
         self._initialization_lock = asyncio.Lock()
 
     @asynccontextmanager
     async def get_bot(self):
         """
         Context manager para obtener una instancia del bot de manera segura.
-        Implementa un patrón de reinicialización automática si la conexión es antigua.
+        
+        El bot es compartido entre envíos concurrentes, por lo que solo se
+        liberan sus recursos ante errores de conexión; los errores propios de
+        un envío (rate limit, petición inválida, timeout) no lo reinicializan.
+        Los fallos de inicialización ya se limpian en _initialize().
         """
+        async with self._initialization_lock:
+            await self._ensure_initialized()
+            bot = self._bot
         try:
+            yield bot
+        except NetworkError as e:
+            if isinstance(e, (BadRequest, TimedOut)):
+                raise
+            logger.error(f"Error de conexión del bot: {str(e)}")
             async with self._initialization_lock:
-                await self._ensure_initialized()
-            yield self._bot
-        except Exception as e:
-            logger.error(f"Error en operación del bot: {str(e)}")
-            await self._cleanup()
+                # Otro envío puede haber reinicializado ya el bot
+                if self._bot is bot:
+                    await self._cleanup()
             raise
 
     async def _ensure_initialized(self) -> None:
         """
-        Asegura que el bot está inicializado y la conexión es reciente.
-        Implementa renovación automática de conexiones antiguas.
+        Asegura que el bot está inicializado. La conexión se reutiliza mientras
+        no haya errores; python-telegram-bot gestiona su propio pool HTTP.
         """
-        current_time = datetime.now()
-        needs_initialization = (
-            self._bot is None or 
-            self._last_initialization is None or
-            (current_time - self._last_initialization).total_seconds() > 3600
-        )
-
-        if needs_initialization:
+        if self._bot is None:
             await self._initialize()
 
     async def _initialize(self) -> None:
@@ -72,7 +75,8 @@ class TelegramService:
             )
             
             self._bot = self._application.bot
-            self._last_initialization = datetime.now()
+            # Sin initialize(), Application.shutdown() no libera el pool HTTP
+            await self._application.initialize()
             logger.info("Bot de Telegram inicializado correctamente")
             
         except Exception as e:
@@ -82,7 +86,8 @@ class TelegramService:
 
     async def send_notification(self, news_item) -> bool:
         """
-        Envía una notificación con reintentos exponenciales y manejo robusto de errores.
+        Envía una notificación con reintentos exponenciales con jitter y manejo
+        robusto de errores.
         """
         for attempt in range(self.max_retries):
             try:
@@ -105,10 +110,16 @@ class TelegramService:
                 return True
                 
             except Exception as e:
-                wait_time = min(2 ** attempt * 5, 60)
+                if isinstance(e, RetryAfter):
+                    # Rate limit de Telegram: respeta el tiempo indicado por la API
+                    wait_time = float(e.retry_after)
+                else:
+                    exponent = min(attempt, 7)
+                    wait_time = min(2 ** exponent * 5, 60)
+                    wait_time = random.uniform(wait_time * 0.5, wait_time)
                 logger.error(
                     f"Intento {attempt + 1}/{self.max_retries} fallido: {str(e)}. "
-                    f"Esperando {wait_time}s antes de reintentar..."
+                    f"Esperando {wait_time:.1f}s antes de reintentar..."
                 )
                 
                 if attempt == self.max_retries - 1:
@@ -127,10 +138,16 @@ class TelegramService:
         if self._application:
             try:
                 await self._application.shutdown()
+                # Cierra también el pool si la inicialización no llegó a completarse,
+                # caso en el que Application.shutdown() no hace nada
+                await self._bot.request.shutdown()
                 logger.info("Limpieza de recursos de Telegram completada")
             except Exception as e:
                 logger.error(f"Error durante la limpieza: {str(e)}")
             finally:
                 self._application = None
                 self._bot = None
-                self._last_initialization = None
\ No newline at end of file
+
+    async def cleanup(self) -> None:
+        """Libera los recursos del bot durante el apagado de la aplicación."""
+        await self._cleanup()
\ No newline at end of file
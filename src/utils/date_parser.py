@@ -1,5 +1,7 @@
 from datetime import datetime
+from functools import lru_cache
 import logging
+import re
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -31,10 +33,20 @@ class DateParser:
         'december': 'december'
     }
     
+    # Patrón único para reemplazar todos los meses en una sola pasada
+    _MONTH_RE = re.compile(
+        r'\b(' + '|'.join(map(re.escape, MONTH_REPLACEMENTS)) + r')\b'
+    )
+    
+    # Último formato que parseó correctamente; se prueba primero
+    _last_good_format: Optional[str] = None
+    
     @classmethod
     def parse_date(cls, date_str: str) -> Optional[datetime]:
         """
         Parsea una cadena de fecha en formato flexible.
+        Los resultados se memorizan, ya que las mismas fechas se repiten
+        en cada ciclo de monitorización.
         
         Args:
             date_str: String que contiene la fecha
@@ -42,18 +54,32 @@ class DateParser:
         Returns:
             datetime opcional con la fecha parseada
         """
+        return _parse_date_cached(date_str)
+    
+    @classmethod
+    def _parse_date(cls, date_str: str) -> Optional[datetime]:
+        """Implementación sin cache de parse_date."""
         if not date_str:
             return None
             
         # Limpieza y normalización del string de fecha
         clean_date = cls._normalize_date_string(date_str)
         
-        # Intenta cada formato conocido
-        for date_format in cls.DATE_FORMATS:
+        # Intenta primero el último formato válido y después el resto
+        formats = cls.DATE_FORMATS
+        if cls._last_good_format:
+            formats = [cls._last_good_format] + [
+                date_format for date_format in formats
+                if date_format != cls._last_good_format
+            ]
+        
+        for date_format in formats:
             try:
-                return datetime.strptime(clean_date, date_format)
+                parsed = datetime.strptime(clean_date, date_format)
             except ValueError:
                 continue
+            cls._last_good_format = date_format
+            return parsed
                 
         logger.warning(f"No se pudo parsear la fecha: {date_str}")
         return None
@@ -73,8 +99,9 @@ class DateParser:
         normalized = date_str.lower().strip()
         
         # Reemplaza nombres de meses en holandés
-        for dutch, english in cls.MONTH_REPLACEMENTS.items():
-            normalized = normalized.replace(dutch, english)
+        normalized = cls._MONTH_RE.sub(
+            lambda match: cls.MONTH_REPLACEMENTS[match.group(0)], normalized
+        )
         
         # Capitaliza para formato estándar
         normalized = normalized.title()
@@ -82,6 +109,7 @@ class DateParser:
         return normalized
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def format_date(date: Optional[datetime], format_str: str = "%d %B %Y") -> str:
         """
         Formatea una fecha para visualización.
@@ -100,4 +128,10 @@ class DateParser:
             return date.strftime(format_str)
         except Exception as e:
             logger.error(f"Error formateando fecha: {e}")
-            return "Error en formato de fecha"
\ No newline at end of file
+            return "Error en formato de fecha"
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """Cache a nivel de módulo para DateParser.parse_date."""
+    return DateParser._parse_date(date_str)